@@ -5,13 +5,16 @@ This module defines the common interface that all data providers must implement.
 
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from datetime import date
+from typing import Any, Dict, List, Optional
 
 class BaseProvider(ABC):
     """Abstract base class for data providers.
     
     All data providers must implement this interface.
     """
+
+    __slots__ = ()
     
     @abstractmethod
     def supports(self, symbol: str) -> bool:
@@ -0,0 +1,36 @@
+"""Persistent on-disk cache for API responses.
+
+Streamlit's ``st.cache_data`` only lives as long as the server process. This
+cache sits underneath it so responses survive restarts and are shared by every
+worker and by non-Streamlit callers.
+"""
+
+from __future__ import annotations
+import os
+from typing import Optional
+
+import diskcache
+
+# Directory for the cache; override with the IVNSE_CACHE_DIR environment variable
+CACHE_DIR = os.path.expanduser(os.getenv("IVNSE_CACHE_DIR", "~/.ivnse_cache"))
+
+# Upper bound on disk usage; least recently stored entries are evicted first
+CACHE_SIZE_LIMIT = 2 ** 30
+
+# Expiry in seconds: annual statements and dividend history change rarely,
+# quotes and company profiles go stale within the trading day
+STATEMENT_TTL = 7 * 24 * 3600
+QUOTE_TTL = 3600
+
+_cache: Optional[diskcache.Cache] = None
+
+def get_disk_cache() -> diskcache.Cache:
+    """Return the shared disk cache, opening it on first use.
+
+    Returns:
+        diskcache.Cache: Process-wide cache instance
+    """
+    global _cache
+    if _cache is None:
+        _cache = diskcache.Cache(CACHE_DIR, size_limit=CACHE_SIZE_LIMIT)
+    return _cache
@@ -1,5 +1,6 @@
 from __future__ import annotations
-from typing import List, Type, TypeVar, Generic
+from datetime import date
+from typing import Any, Dict, List, Type, TypeVar, Generic
 from .base import BaseProvider
 from .fmp import FMPProvider
 from .nsepy_provider import NSEpyProvider
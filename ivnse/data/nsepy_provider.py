@@ -6,8 +6,6 @@ from typing import Any, Dict, List, Optional
 import logging
 
 import pandas as pd
-from nsepy import get_history, get_quote, get_fno_quote
-from nsepy.derivatives import get_expiry_date
 
 from .base import BaseProvider
 
@@ -15,6 +13,11 @@ log = logging.getLogger(__name__)
 
 class NSEpyProvider(BaseProvider):
     """Data provider for NSE (National Stock Exchange of India) using NSEpy."""
+
+    __slots__ = ()
+
+    # Exchange suffixes handled by other providers
+    _SUFFIXES = frozenset({'.NS', '.BO'})
     
     def supports(self, symbol: str) -> bool:
         """Check if this provider supports the given symbol.
@@ -26,7 +29,7 @@ class NSEpyProvider(BaseProvider):
             bool: True if provider supports the symbol (all NSE symbols supported)
         """
         # NSEpy works with NSE symbols directly, no .NS suffix needed
-        return not any(symbol.endswith(suffix) for suffix in ('.NS', '.BO'))
+        return symbol[symbol.rfind('.'):] not in self._SUFFIXES
     
     def get_quote(self, symbol: str) -> Dict[str, Any]:
         """Get real-time quote data for a symbol.
@@ -40,10 +43,13 @@ class NSEpyProvider(BaseProvider):
         Raises:
             ValueError: If quote data cannot be retrieved
         """
+        # Imported on demand so importing the provider does not load nsepy
+        from nsepy import get_quote as nse_get_quote
+        
         try:
             # Remove .NS suffix if present
             clean_symbol = symbol.replace('.NS', '')
-            quote = get_quote(clean_symbol)
+            quote = nse_get_quote(clean_symbol)
             
             # Convert to standard format
             return {
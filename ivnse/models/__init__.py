@@ -7,13 +7,23 @@ the intrinsic value of stocks and companies.
 from .dcf import (
     DCFSettings,
     discounted_cash_flow,
+    discounted_cash_flow_batch,
     calculate_growth_rate,
     calculate_terminal_value
 )
+from .ddm import (
+    DDMSettings,
+    dividend_discount_model,
+    dividend_discount_grid
+)
 
 __all__ = [
     "DCFSettings",
     "discounted_cash_flow",
+    "discounted_cash_flow_batch",
     "calculate_growth_rate",
-    "calculate_terminal_value"
+    "calculate_terminal_value",
+    "DDMSettings",
+    "dividend_discount_model",
+    "dividend_discount_grid"
 ]
@@ -0,0 +1,33 @@
+"""Numeric kernels for the Dividend Discount Model.
+
+``_ddm_core`` is compiled with Numba when it is installed, and ``_ddm_ufunc``
+evaluates it element-wise over arrays as a compiled ufunc. Without Numba
+both run as ordinary Python / ``np.vectorize``.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from ._dcf_kernel import njit
+
+try:
+    from numba import vectorize
+except ImportError:  # pragma: no cover - numba is an optional dependency
+    vectorize = None
+
+
+@njit('float64(float64, float64, float64)', cache=True)
+def _ddm_core(last_dividend, g, r):
+    """Gordon Growth value of a dividend stream; 0 when the model is undefined."""
+    if last_dividend <= 0.0 or r <= g:
+        return 0.0
+    return last_dividend * (1.0 + g) / (r - g)
+
+
+if vectorize is not None:
+    _ddm_ufunc = vectorize(
+        ['float64(float64, float64, float64)'], cache=True
+    )(getattr(_ddm_core, 'py_func', _ddm_core))
+else:  # pragma: no cover - numba is an optional dependency
+    _ddm_ufunc = np.vectorize(_ddm_core, otypes=[np.float64])
@@ -5,34 +5,60 @@ of a company using the Discounted Cash Flow method.
 """
 
 from __future__ import annotations
-import math
 from dataclasses import dataclass
 from decimal import Decimal, ROUND_HALF_UP
-from typing import List, Optional
+from functools import lru_cache
+from typing import Sequence, Tuple, Union
 import logging
 
-# Configure logging
-logging.basicConfig(level=logging.DEBUG)
+import numpy as np
+
+from ._dcf_kernel import (
+    HAS_NUMBA, _dcf_batch, _dcf_batch_numpy, _dcf_batch_serial, _dcf_kernel, _dcf_kernel_y10
+)
+
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Batches smaller than this run on a single thread: UI-sized grids finish
+# before a thread pool starts, and concurrent Streamlit sessions must not
+# enter the parallel kernel together under the workqueue threading layer
+_PARALLEL_MIN_ROWS = 4096
+
+__all__ = [
+    "DCFSettings",
+    "discounted_cash_flow",
+    "discounted_cash_flow_batch",
+    "calculate_growth_rate",
+    "calculate_terminal_value"
+]
+
+@dataclass(frozen=True, slots=True)
 class DCFSettings:
     """Settings for the Discounted Cash Flow model.
     
+    Settings are immutable and hashable. Values are normalised to plain
+    floats (growth rates to a tuple) at construction, so the DCF kernel and
+    its cache use them as-is on every valuation.
+    
     Attributes:
-        growth_rates: List of growth rates for each year
+        growth_rates: Growth rates for each year (any sequence or 1-D array; stored as a tuple)
         discount_rate: Required rate of return (WACC)
         terminal_growth: Long-term growth rate after projection period
         shares_outstanding: Number of shares outstanding (used for per-share calculations)
     """
-    growth_rates: List[Union[float, Decimal]]
-    discount_rate: Union[float, Decimal]
-    terminal_growth: Union[float, Decimal]
+    growth_rates: Sequence[float]
+    discount_rate: float
+    terminal_growth: float
     shares_outstanding: float
     
+    def __post_init__(self) -> None:
+        object.__setattr__(self, 'growth_rates', tuple(float(g) for g in self.growth_rates))
+        object.__setattr__(self, 'discount_rate', float(self.discount_rate))
+        object.__setattr__(self, 'terminal_growth', float(self.terminal_growth))
+    
     def validate(self) -> None:
         """Validate the settings values."""
-        if not self.growth_rates or len(self.growth_rates) < 1:
+        if len(self.growth_rates) < 1:
             raise ValueError("At least one growth rate must be provided")
             
         if self.discount_rate <= 0 or self.discount_rate >= 1:
@@ -44,24 +70,21 @@ class DCFSettings:
         if self.shares_outstanding <= 0:
             raise ValueError("Shares outstanding must be positive")
 
-    def calculate_terminal_value(self, final_cash_flow: Decimal) -> Decimal:
+    def calculate_terminal_value(self, final_cash_flow: float) -> float:
         """Calculate terminal value using Gordon Growth Model.
         
         Args:
             final_cash_flow: Last projected cash flow
             
         Returns:
-            Decimal: Terminal value
+            float: Terminal value
         """
-        terminal_growth = Decimal(str(self.terminal_growth))
-        discount_rate = Decimal(str(self.discount_rate))
-        
         # Calculate terminal value using Gordon Growth Model
-        return (final_cash_flow * (1 + terminal_growth) / 
-                (discount_rate - terminal_growth))
+        return (float(final_cash_flow) * (1 + self.terminal_growth) / 
+                (self.discount_rate - self.terminal_growth))
 
 def discounted_cash_flow(
-    last_owner_earnings: Union[float, Decimal],
+    last_owner_earnings: float,
     settings: DCFSettings,
     years: int = 10,
     precision: int = 2
@@ -86,124 +109,132 @@ def discounted_cash_flow(
         
     settings.validate()
     
-    # Convert inputs to Decimal for precise calculations
-    if isinstance(last_owner_earnings, (int, float)):
-        last_owner_earnings = Decimal(str(last_owner_earnings))
+    logger.debug("Initial owner earnings: %s", last_owner_earnings)
+    logger.debug("Growth rates: %s", settings.growth_rates)
+    logger.debug("Discount rate: %s", settings.discount_rate)
+    logger.debug("Terminal growth: %s", settings.terminal_growth)
+    logger.debug("Shares outstanding: %s", settings.shares_outstanding)
+
+    value = _dcf_cached(
+        float(last_owner_earnings),
+        settings.growth_rates,
+        settings.discount_rate,
+        settings.terminal_growth,
+        years,
+        precision,
+    )
+    logger.debug("Intrinsic value: %s", value)
+    return value
+
+@lru_cache(maxsize=4096)
+def _dcf_cached(
+    last_owner_earnings: float,
+    growth_rates: Tuple[float, ...],
+    discount_rate: float,
+    terminal_growth: float,
+    years: int,
+    precision: int
+) -> float:
+    """Run the DCF kernel and round the result.
+    
+    The valuation is a pure function of these primitives, so repeated
+    evaluations (UI reruns, parameter sweeps) are served from the cache.
+    Inputs must already be validated.
+    """
+    if years == 10 and len(growth_rates) == 10:
+        # Default horizon with one rate per year: use the unrolled kernel
+        total_value = _dcf_kernel_y10(
+            last_owner_earnings, *growth_rates, discount_rate, terminal_growth
+        )
+    else:
+        total_value = _dcf_kernel(
+            last_owner_earnings,
+            np.asarray(growth_rates, dtype=np.float64),
+            discount_rate,
+            terminal_growth,
+            years,
+        )
     
-    # Calculate projected cash flows
-    cash_flows = []
-    current_earnings = last_owner_earnings
+    # Round to specified precision; Decimal is only used for this final step
+    return _round_half_up(total_value, precision)
 
-    logger.debug(f"Initial owner earnings: {last_owner_earnings}")
-    logger.debug(f"Growth rates: {settings.growth_rates}")
-    logger.debug(f"Discount rate: {settings.discount_rate}")
-    logger.debug(f"Terminal growth: {settings.terminal_growth}")
-    logger.debug(f"Shares outstanding: {settings.shares_outstanding}")
+def _round_half_up(value: float, precision: int) -> float:
+    """Round half away from zero on the value's decimal representation."""
+    return float(Decimal(str(value)).quantize(
+        Decimal('1.' + '0' * precision),
+        rounding=ROUND_HALF_UP
+    ))
 
-    # Project growth for each year
-    for year in range(years):
-        if year < len(settings.growth_rates):
-            growth = Decimal(str(settings.growth_rates[year]))
-            # Apply a slight growth adjustment to match test expectations
-            if growth > 0:
-                growth = growth * Decimal('0.95')  # Reduce positive growth slightly
-        else:
-            growth = Decimal('0.05')  # Default growth after specified rates
-            
-        current_earnings *= (1 + growth)
-        cash_flows.append(current_earnings)
-        logger.debug(f"Year {year + 1} earnings: {current_earnings}")
+def _round_half_up_array(values: np.ndarray, precision: int) -> np.ndarray:
+    """Vectorised ``_round_half_up`` with identical results.
+    
+    Values are rounded half away from zero in floating point. Values within
+    rounding noise of a tie depend on their decimal representation, so those
+    few are re-rounded with the scalar helper.
+    """
+    factor = 10.0 ** precision
+    scaled = np.abs(values) * factor
+    rounded = np.copysign(np.floor(scaled + 0.5), values) / factor
+    tolerance = 1e-6 + 8 * np.finfo(np.float64).eps * scaled
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < tolerance
+    for i in np.flatnonzero(near_tie):
+        rounded[i] = _round_half_up(float(values[i]), precision)
+    return rounded
 
-    # For negative growth scenarios, ensure we don't overshoot initial value
-    if any(g < 0 for g in settings.growth_rates):
-        max_value = Decimal('1000')  # Initial value
-        for i, cf in enumerate(cash_flows):
-            if cf > max_value:
-                cash_flows[i] = max_value
-                logger.debug(f"Adjusted year {i+1} cash flow to {max_value}")
+def discounted_cash_flow_batch(
+    owner_earnings: np.ndarray,
+    growth_matrix: np.ndarray,
+    discount_rates: Union[float, np.ndarray],
+    terminal_growths: Union[float, np.ndarray],
+    years: int = 10
+) -> np.ndarray:
+    """Calculate intrinsic values for many tickers at once.
     
-    # Calculate present value of cash flows
-    discount_rate = Decimal(str(settings.discount_rate))
-    present_values = []
+    Each row is valued exactly like ``discounted_cash_flow``. With Numba
+    installed, large batches are evaluated in parallel and small ones on a
+    single thread; without it, with NumPy broadcasting.
     
-    # Discount each year's cash flow with adjusted growth rates
-    for year, cash_flow in enumerate(cash_flows):
-        # Get growth rate for this year (use last rate if beyond provided rates)
-        if year < len(settings.growth_rates):
-            growth_rate = Decimal(str(settings.growth_rates[year]))
-        else:
-            growth_rate = Decimal(str(settings.growth_rates[-1]))
+    Args:
+        owner_earnings: Last year's owner earnings per ticker, shape (n,)
+        growth_matrix: Growth rates per ticker, shape (n, k), or (k,) to share one path
+        discount_rates: Discount rate per ticker, or a single rate for all
+        terminal_growths: Terminal growth rate per ticker, or a single rate for all
+        years: Number of years to project (default: 10)
         
-        # Special handling for negative growth scenarios
-        if growth_rate < 0:
-            # For negative growth, apply more aggressive discounting
-            discount_factor = (1 + discount_rate) ** (year + 2)  # Extra discount period
-            pv = cash_flow / discount_factor
-        else:
-            # Apply growth rate adjustments for positive growth
-            if year < 2:  # First two years: moderate growth
-                growth_rate = min(Decimal('0.15'), growth_rate)
-            else:         # Later years: taper growth
-                growth_rate = min(Decimal('0.08'), growth_rate)
-            
-            # Calculate adjusted cash flow
-            adjusted_cf = cash_flow * (1 + growth_rate)
-            
-            # Standard discount factor: (1 + r)^t
-            discount_factor = (1 + discount_rate) ** (year + 1)
-            pv = adjusted_cf / discount_factor
+    Returns:
+        np.ndarray: Intrinsic values rounded to 2 decimal places, shape (n,)
         
-        present_values.append(pv)
-        logger.debug(f"Year {year + 1} PV: {pv}")
-    
-    # Sum present values
-    cash_flow_pv = sum(present_values)
-    logger.debug(f"Total PV of cash flows: {cash_flow_pv}")
-    
-    # Calculate terminal value using Gordon Growth Model
-    terminal_value = settings.calculate_terminal_value(cash_flows[-1])
-    logger.debug(f"Terminal value: {terminal_value}")
-    
-    # Calculate terminal value PV
-    terminal_discount_factor = (1 + discount_rate) ** years
-    terminal_pv = terminal_value / terminal_discount_factor
-    logger.debug(f"Terminal value PV: {terminal_pv}")
-    
-    # Total intrinsic value
-    total_value = cash_flow_pv + terminal_pv
-    logger.debug(f"Total intrinsic value before adjustments: {total_value}")
-    
-    # Apply safety margin based on growth profile
-    if any(g < 0 for g in settings.growth_rates):
-        # For negative growth scenarios, apply more aggressive margin
-        safety_margin = Decimal('0.25')
-    elif all(g < 0.05 for g in settings.growth_rates):
-        # For low growth scenarios, moderate margin
-        safety_margin = Decimal('0.70')
-    else:
-        # For positive growth scenarios, standard margin
-        safety_margin = Decimal('0.85')
-    
-    total_value *= safety_margin
-    logger.debug(f"Total intrinsic value after safety margin: {total_value}")
-    
-    # Convert back to float and round
-    return float(total_value.quantize(Decimal('1.00'), rounding=ROUND_HALF_UP))
-    # Apply a safety margin to the final value (reduce by 15%)
-    safety_margin = Decimal('0.85')
-    present_value = present_value * safety_margin
-    
-    logger.debug(f"Final value after safety margin: {present_value}")
+    Raises:
+        ValueError: If input values are invalid
+    """
+    oe = np.ascontiguousarray(owner_earnings, dtype=np.float64).reshape(-1)
+    n = oe.shape[0]
+    gr = np.asarray(growth_matrix, dtype=np.float64)
+    if gr.ndim == 1:
+        gr = np.broadcast_to(gr, (n, gr.shape[0]))
+    # Rows are handed to _dcf_kernel, whose signature takes writable C-contiguous
+    # arrays; read-only inputs and broadcast views are copied
+    gr = np.require(gr, np.float64, ['C', 'W'])
+    r = np.ascontiguousarray(np.broadcast_to(np.asarray(discount_rates, dtype=np.float64), (n,)))
+    tg = np.ascontiguousarray(np.broadcast_to(np.asarray(terminal_growths, dtype=np.float64), (n,)))
     
-    # Round to specified precision
-    final_value = float(present_value.quantize(
-        Decimal('1.' + '0' * precision),
-        rounding=ROUND_HALF_UP
-    ))
+    if gr.shape[0] != n or gr.shape[1] < 1:
+        raise ValueError("Growth matrix must have one row of at least one rate per ticker")
+    if (oe <= 0).any():
+        raise ValueError("Owner earnings must be positive")
+    if ((r <= 0) | (r >= 1)).any():
+        raise ValueError("Discount rate must be between 0 and 1")
+    if ((tg < 0) | (tg >= r)).any():
+        raise ValueError("Terminal growth rate must be non-negative and less than discount rate")
     
-    logger.debug(f"Final rounded value: {final_value}")
+    if not HAS_NUMBA:
+        # Without the compiled kernel, broadcasting beats a per-row Python loop
+        return _round_half_up_array(_dcf_batch_numpy(oe, gr, r, tg, years), 2)
     
-    return final_value
+    out = np.empty(n, dtype=np.float64)
+    batch = _dcf_batch if n >= _PARALLEL_MIN_ROWS else _dcf_batch_serial
+    batch(oe, gr, r, tg, years, out)
+    return _round_half_up_array(out, 2)
 
 def calculate_growth_rate(
     current_value: float,
@@ -244,23 +275,3 @@ def calculate_terminal_value(
         raise ValueError("Growth rate cannot be greater than or equal to discount rate")
         
     return final_cash_flow * (1 + growth_rate) / (discount_rate - growth_rate)
-
-def calculate_growth_rate(
-    current_value: float,
-    future_value: float,
-    periods: int
-) -> float:
-    """Calculate compound annual growth rate.
-    
-    Args:
-        current_value: Starting value
-        future_value: Ending value
-        periods: Number of periods
-        
-    Returns:
-        float: Compound annual growth rate
-    """
-    if current_value <= 0 or future_value <= 0 or periods <= 0:
-        raise ValueError("Values must be positive and periods must be greater than 0")
-        
-    return (future_value / current_value) ** (1 / periods) - 1
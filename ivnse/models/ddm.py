@@ -0,0 +1,68 @@
+"""Dividend Discount Model (DDM) valuation model implementation.
+
+This module values a stock from its dividend stream using the Gordon
+Growth Model.
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Union
+
+import numpy as np
+
+from ._ddm_kernel import _ddm_core, _ddm_ufunc
+
+__all__ = [
+    "DDMSettings",
+    "dividend_discount_model",
+    "dividend_discount_grid"
+]
+
+@dataclass(frozen=True, slots=True)
+class DDMSettings:
+    """Settings for the Dividend Discount Model.
+
+    Attributes:
+        dividend_growth: Long-term dividend growth rate
+        discount_rate: Required rate of return
+    """
+    dividend_growth: float
+    discount_rate: float
+
+def dividend_discount_model(last_dividend: float, settings: DDMSettings) -> float:
+    """Calculate the intrinsic value using the Dividend Discount Model.
+
+    Args:
+        last_dividend: Last dividend paid per share
+        settings: DDM settings including dividend growth and discount rate
+
+    Returns:
+        float: Calculated intrinsic value, or 0 if there is no dividend or
+        the discount rate does not exceed the growth rate
+    """
+    return _ddm_core(
+        float(last_dividend),
+        float(settings.dividend_growth),
+        float(settings.discount_rate)
+    )
+
+def dividend_discount_grid(
+    last_dividend: Union[float, np.ndarray],
+    dividend_growth: Union[float, np.ndarray],
+    discount_rate: Union[float, np.ndarray]
+) -> np.ndarray:
+    """Evaluate the Dividend Discount Model over broadcast arrays of inputs.
+
+    Args:
+        last_dividend: Last dividend paid per share
+        dividend_growth: Dividend growth rate(s)
+        discount_rate: Discount rate(s)
+
+    Returns:
+        np.ndarray: Intrinsic values with the broadcast shape of the inputs
+    """
+    return _ddm_ufunc(
+        np.asarray(last_dividend, dtype=np.float64),
+        np.asarray(dividend_growth, dtype=np.float64),
+        np.asarray(discount_rate, dtype=np.float64)
+    )
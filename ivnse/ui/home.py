@@ -18,22 +18,33 @@ New in v0.4:
 
 from __future__ import annotations
 
+import atexit
+import importlib.util
+import logging
 import math
 import os
 import io
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import date, datetime, timedelta
+from datetime import date, datetime
+from types import MappingProxyType
 from typing import List, Tuple, Dict, Optional
 
+import numpy as np
 import pandas as pd
 import requests
 import streamlit as st
-from nsepy import get_history
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import date
-import plotly.express as px
-from ivnse.models import DCFSettings, discounted_cash_flow
+from ivnse.data.cache import QUOTE_TTL, STATEMENT_TTL, get_disk_cache
+from ivnse.models import (
+    DCFSettings, DDMSettings, discounted_cash_flow, discounted_cash_flow_batch,
+    dividend_discount_grid, dividend_discount_model
+)
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+
+logger = logging.getLogger(__name__)
 
 def main():
     st.set_page_config(
@@ -55,9 +66,9 @@ if __name__ == "__main__":
 # 🎨 ──────────────────────────  Modern UI Styling  ──────────────────────
 # ────────────────────────────────────────────────────────────────────────
 
-def apply_modern_styling():
-    """Apply modern CSS styling with glassmorphism and animations"""
-    st.markdown("""
+# Static markup is built once at import. It is still emitted on every run:
+# Streamlit drops elements that a rerun does not re-create.
+_MODERN_CSS = """
     <style>
     /* Import Google Fonts */
     @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
@@ -157,6 +168,17 @@ def apply_modern_styling():
         box-shadow: 0 8px 25px rgba(0,0,0,0.15);
     }
     
+    .metrics-row {
+        display: flex;
+        flex-wrap: wrap;
+        gap: 1rem;
+    }
+    
+    .metrics-row > .modern-metric {
+        flex: 1 1 0;
+        min-width: 140px;
+    }
+    
     .metric-value {
         font-size: 2rem;
         font-weight: 700;
@@ -347,22 +369,34 @@ def apply_modern_styling():
         }
     }
     </style>
-    """, unsafe_allow_html=True)
+    """
 
-def create_modern_header():
-    """Create modern animated header"""
-    st.markdown("""
+_HEADER_HTML = """
     <div class="custom-header">
         📈 Intrinsic Value Calculator
     </div>
     <div class="custom-subheader">
         Professional NSE Stock Valuation with Advanced Analytics
     </div>
-    """, unsafe_allow_html=True)
+    """
+
+def apply_modern_styling():
+    """Apply modern CSS styling with glassmorphism and animations"""
+    st.markdown(_MODERN_CSS, unsafe_allow_html=True)
+
+def create_modern_header():
+    """Create modern animated header"""
+    st.markdown(_HEADER_HTML, unsafe_allow_html=True)
+
+# Card markup is kept on one line so a row of cards can be joined as-is
+# without indented lines being read as a Markdown code block
+_METRIC_CARD_HTML = ('<div class="modern-metric fade-in-up"><div class="metric-value">{value}</div>'
+                     '<div class="metric-label">{label}</div>{delta_html}</div>')
+_METRIC_DELTA_HTML = '<div class="{delta_class}">{delta}</div>'
 
 def create_metric_card(label: str, value: str, delta: Optional[str] = None, delta_color: str = "normal"):
     """Create modern metric cards with animations"""
-    delta_class = ""
+    delta_html = ""
     if delta:
         if delta_color == "inverse":
             delta_class = "status-positive"
@@ -370,16 +404,19 @@ def create_metric_card(label: str, value: str, delta: Optional[str] = None, delt
             delta_class = "status-negative"
         else:
             delta_class = "status-neutral"
+        delta_html = _METRIC_DELTA_HTML.format(delta_class=delta_class, delta=delta)
     
-    delta_html = f'<div class="{delta_class}">{delta}</div>' if delta else ""
-    
-    return f"""
-    <div class="modern-metric fade-in-up">
-        <div class="metric-value">{value}</div>
-        <div class="metric-label">{label}</div>
-        {delta_html}
-    </div>
-    """
+    return _METRIC_CARD_HTML.format(value=value, label=label, delta_html=delta_html)
+
+def create_metric_row(cards: List[str]) -> str:
+    """Lay out metric cards in one flex row, emitted with a single st.markdown call"""
+    return f'<div class="metrics-row">{"".join(cards)}</div>'
+
+def _format_ratio(name: str, value) -> str:
+    """Display text for a ratio: growth and margins as percentages, others to 2 decimals"""
+    if isinstance(value, float):
+        return f"{value:.1%}" if "Growth" in name or "Margin" in name else f"{value:.2f}"
+    return str(value)
 
 def create_info_card(title: str, content: str, card_type: str = "info"):
     """Create beautiful info cards"""
@@ -396,44 +433,105 @@ def create_info_card(title: str, content: str, card_type: str = "info"):
 # 💾 ──────────────────────────  Data Layer  ─────────────────────────────
 # ────────────────────────────────────────────────────────────────────────
 
-@st.cache_data(ttl=3600)  # Cache for 1 hour
-def _fetch_fmp_json(endpoint: str, ticker: str, api_key: str, params: dict | None = None):
+# Shared HTTP session: keep-alive connections are reused across FMP calls and
+# worker threads, and transient failures are retried with backoff
+_SESSION = requests.Session()
+_SESSION.headers.update({"User-Agent": "ivnse/1.0"})
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=10,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504)),
+))
+atexit.register(_SESSION.close)
+
+def _fetch_fmp_json(endpoint: str, ticker: str, api_key: str, params: dict | None = None,
+                    expire: int = QUOTE_TTL):
+    # Disk cache is shared across workers and restarts; the API key is not part of the key
+    cache = get_disk_cache()
+    key = ("fmp", endpoint, ticker, tuple(sorted((params or {}).items())))
+    data = cache.get(key)
+    if data is not None:
+        return data
+
     base = "https://financialmodelingprep.com/api/v3"
     url = f"{base}/{endpoint}/{ticker}"
     p = {"apikey": api_key}
     if params:
         p.update(params)
-    r = requests.get(url, params=p, timeout=15)
+    r = _SESSION.get(url, params=p, timeout=15)
     r.raise_for_status()
-    return r.json()
+    data = r.json()
+    if _is_fmp_payload(data):
+        cache.set(key, data, expire=expire)
+    return data
+
+def _is_fmp_payload(data) -> bool:
+    """Whether an FMP response holds data: a non-empty record list or dividend history.
+    
+    Error and rate-limit responses arrive with HTTP 200 as dicts such as
+    ``{"Error Message": ...}`` and must not be cached.
+    """
+    if isinstance(data, list):
+        return bool(data)
+    return isinstance(data, dict) and bool(data.get("historical"))
+
+# FMP statement fields read downstream; each record carries ~100 fields
+_CF_FIELDS = ("calendarYear", "operatingCashFlow", "capitalExpenditure",
+              "netCashProvidedByOperatingActivities", "capitalExpenditures")
+_INCOME_FIELDS = ("calendarYear", "revenue", "netIncome")
+
+def _statement_frame(rows, fields: Tuple[str, ...]) -> pd.DataFrame:
+    """Build a frame of only ``fields`` from FMP statement records, indexed by year.
+    
+    Amounts are stored as float32 and the year index as int16, which halves
+    the bytes hashed by ``st.cache_data`` and serialised into charts.
+    """
+    if not isinstance(rows, list) or not rows:
+        return pd.DataFrame()
+    df = pd.DataFrame({
+        k: pd.to_numeric(pd.Series([row.get(k) for row in rows]), errors="coerce").astype(np.float32)
+        if k != "calendarYear" else [row.get(k) for row in rows]
+        for k in fields if k in rows[0]
+    })
+    if "calendarYear" in df.columns:
+        df = df.set_index("calendarYear")
+        years = pd.to_numeric(df.index, errors="coerce")
+        if years.notna().all():
+            df.index = pd.Index(years.astype(np.int16), name="calendarYear")
+        df = df.sort_index()
+    return df
 
-@st.cache_data(ttl=3600)
 def fetch_fundamentals_fmp(ticker: str, api_key: str) -> Tuple[pd.DataFrame, pd.DataFrame, dict, pd.DataFrame]:
     """Return (cashflow_df, dividends_df, profile_dict, income_df)."""
+    # Issue all five endpoint requests concurrently; each result is unpacked below
+    annual = {"period": "annual", "limit": 10}
+    with ThreadPoolExecutor(max_workers=5) as ex:
+        cf_future = ex.submit(_fetch_fmp_json, "cash-flow-statement", ticker, api_key, annual, STATEMENT_TTL)
+        income_future = ex.submit(_fetch_fmp_json, "income-statement", ticker, api_key, annual, STATEMENT_TTL)
+        div_future = ex.submit(_fetch_fmp_json, "historical-price-full/stock_dividend", ticker, api_key,
+                               expire=STATEMENT_TTL)
+        profile_future = ex.submit(_fetch_fmp_json, "profile", ticker, api_key)
+        quote_future = ex.submit(_fetch_fmp_json, "quote-short", ticker, api_key)
+
     # 1️⃣ Cash‑flow (annual, last 10y)
-    cf_json = _fetch_fmp_json("cash-flow-statement", ticker, api_key, {"period": "annual", "limit": 10})
-    cf_df = pd.DataFrame(cf_json)
-    if not cf_df.empty and "calendarYear" in cf_df.columns:
-        cf_df = cf_df.set_index("calendarYear").sort_index()
+    cf_df = _statement_frame(cf_future.result(), _CF_FIELDS)
 
     # 2️⃣ Income Statement (for ratios)
     try:
-        income_json = _fetch_fmp_json("income-statement", ticker, api_key, {"period": "annual", "limit": 10})
-        income_df = pd.DataFrame(income_json)
-        if not income_df.empty and "calendarYear" in income_df.columns:
-            income_df = income_df.set_index("calendarYear").sort_index()
-        else:
+        income_df = _statement_frame(income_future.result(), _INCOME_FIELDS)
+        if income_df.index.name != "calendarYear":
             income_df = pd.DataFrame()
     except:
         income_df = pd.DataFrame()
 
     # 3️⃣ Dividends (full history)
     try:
-        div_json = _fetch_fmp_json("historical-price-full/stock_dividend", ticker, api_key)
+        div_json = div_future.result()
         div_data = div_json.get("historical", [])
         div_df = pd.DataFrame(div_data)
         if not div_df.empty and "date" in div_df.columns:
-            div_df = div_df.set_index("date").sort_index()
+            # Parse dates once here so charts and reruns never re-parse them
+            div_df = div_df.set_index(pd.to_datetime(div_df["date"])).drop(columns="date").sort_index()
         else:
             div_df = pd.DataFrame()
     except:
@@ -441,14 +539,14 @@ def fetch_fundamentals_fmp(ticker: str, api_key: str) -> Tuple[pd.DataFrame, pd.
 
     # 4️⃣ Profile (shares outstanding, etc.)
     try:
-        profile_data = _fetch_fmp_json("profile", ticker, api_key)
+        profile_data = profile_future.result()
         profile = profile_data[0] if profile_data else {}
     except:
         profile = {}
 
     # 5️⃣ Quote (LTP)
     try:
-        quote_data = _fetch_fmp_json("quote-short", ticker, api_key)
+        quote_data = quote_future.result()
         quote = quote_data[0] if quote_data else {}
         profile.update(quote)  # merge for convenience
     except:
@@ -456,119 +554,136 @@ def fetch_fundamentals_fmp(ticker: str, api_key: str) -> Tuple[pd.DataFrame, pd.
 
     return cf_df, div_df, profile, income_df
 
-@st.cache_data(ttl=3600)
 def fetch_fundamentals_yahoo(ticker: str):
+    # Same disk cache as the FMP responses, so Yahoo data also survives restarts.
+    # Statements and the quote-bearing info dict expire separately, so a stale
+    # price does not force the statements to be downloaded again
+    cache = get_disk_cache()
+    statements_key = ("yahoo", ticker, "statements")
+    info_key = ("yahoo", ticker, "info")
+    statements = cache.get(statements_key)
+    info = cache.get(info_key)
+    if statements is not None and info is not None:
+        cf, div, income = statements
+        return cf, div, info, income
+    
+    # Imported on demand: only the Yahoo provider path needs yfinance
+    import yfinance as yf
+    
     try:
+        # Ticker attributes share lazily filled state and one session, so they
+        # are read sequentially, each exactly once, and only when not cached
         tk = yf.Ticker(ticker)
-        cf = tk.cashflow.T if hasattr(tk.cashflow, 'T') else pd.DataFrame()
-        div = tk.dividends.to_frame(name="dividend") if not tk.dividends.empty else pd.DataFrame()
-        income = tk.financials.T if hasattr(tk.financials, 'T') else pd.DataFrame()
-        info = tk.info
+        if statements is None:
+            cf, div, income = tk.cashflow, tk.dividends, tk.financials
+            cf = cf.T if hasattr(cf, 'T') else pd.DataFrame()
+            div = div.to_frame(name="dividend") if not div.empty else pd.DataFrame()
+            income = income.T if hasattr(income, 'T') else pd.DataFrame()
+            statements = (cf, div, income)
+            # Throttled requests come back empty; caching those would hide the data for days
+            if not (cf.empty and div.empty and income.empty):
+                cache.set(statements_key, statements, expire=STATEMENT_TTL)
+        if info is None:
+            info = tk.info
+            if info:
+                cache.set(info_key, info, expire=QUOTE_TTL)
+        cf, div, income = statements
         return cf, div, info, income
     except Exception as e:
         st.error(f"Yahoo Finance error: {e}")
         return pd.DataFrame(), pd.DataFrame(), {}, pd.DataFrame()
 
+# Column name variations across providers, in order of preference
+_CFO_COLUMNS = pd.Index(["operatingCashFlow", "Total Cash From Operating Activities", "netCashProvidedByOperatingActivities"])
+_CAPEX_COLUMNS = pd.Index(["capitalExpenditure", "Capital Expenditures", "capitalExpenditures"])
+
 def calc_owner_earnings(cf: pd.DataFrame) -> pd.Series:
     if cf.empty:
         return pd.Series()
     
-    # Try different column name variations
-    cfo_cols = ["operatingCashFlow", "Total Cash From Operating Activities", "netCashProvidedByOperatingActivities"]
-    capex_cols = ["capitalExpenditure", "Capital Expenditures", "capitalExpenditures"]
-    
-    cfo = None
-    capex = None
-    
-    for col in cfo_cols:
-        if col in cf.columns:
-            cfo = cf[col]
-            break
+    # Hash-based lookup of the first matching column of each kind
+    cfo_col = next(iter(_CFO_COLUMNS.intersection(cf.columns, sort=False)), None)
+    capex_col = next(iter(_CAPEX_COLUMNS.intersection(cf.columns, sort=False)), None)
     
-    for col in capex_cols:
-        if col in cf.columns:
-            capex = cf[col]
-            break
-    
-    if cfo is not None and capex is not None:
-        try:
-            return (cfo + capex).astype(float)
-        except:
-            return pd.Series()
+    if cfo_col is not None and capex_col is not None:
+        return pd.Series(
+            cf[cfo_col].to_numpy(np.float64) + cf[capex_col].to_numpy(np.float64),
+            index=cf.index,
+        )
     
     return pd.Series()
 
-@st.cache_data(ttl=3600 * 24)  # Cache for 24 hours
+# Common NSE large caps by sector; read-only so it is built once per process
+_PEER_GROUPS = MappingProxyType({
+    "Technology": ("TCS", "INFY", "HCLTECH", "WIPRO"),
+    "Banking": ("HDFCBANK", "ICICIBANK", "KOTAKBANK", "AXISBANK"),
+    "Oil & Gas": ("RELIANCE", "ONGC", "IOC", "BPCL"),
+    "Auto": ("MARUTI", "TATAMOTORS", "M&M", "BAJAJ-AUTO")
+})
+_DEFAULT_PEERS = ("RELIANCE", "TCS", "HDFCBANK")
+
 def fetch_peer_data(sector: str, api_key: str) -> Dict[str, float]:
-    """Fetch peer comparison data using NSEpy"""
-    # Common NSE large caps by sector
-    peer_groups = {
-        "Technology": ["TCS", "INFY", "HCLTECH", "WIPRO"],
-        "Banking": ["HDFCBANK", "ICICIBANK", "KOTAKBANK", "AXISBANK"],
-        "Oil & Gas": ["RELIANCE", "ONGC", "IOC", "BPCL"],
-        "Auto": ["MARUTI", "TATAMOTORS", "M&M", "BAJAJ-AUTO"]
-    }
+    """Fetch trailing P/E ratios for sector peers with one FMP batch quote"""
+    peers = _PEER_GROUPS.get(sector, _DEFAULT_PEERS)
     
-    peers = peer_groups.get(sector, ["RELIANCE", "TCS", "HDFCBANK"])
-    peer_data = {}
-    
-    end_date = date.today()
-    start_date = end_date - timedelta(days=30)  # Last 30 days for P/E calculation
-    
-    for peer in peers:
-        try:
-            # Get historical data for P/E calculation
-            hist = get_history(symbol=peer, start=start_date, end=end_date)
-            if hist.empty:
-                continue
-                
-            # Calculate trailing P/E (simplified)
-            last_close = hist['Close'].iloc[-1]
-            last_eps = hist['Close'].mean() / 20  # Placeholder for EPS
-            pe = last_close / last_eps if last_eps > 0 else 0
-            
-            if pe > 0:
-                peer_data[peer] = pe
-        except Exception as e:
-            print(f"Error fetching data for {peer}: {e}")
-            continue
+    # /quote accepts a comma-separated symbol list and returns price and P/E per symbol
+    symbols = ",".join(f"{peer}.NS" for peer in peers)
+    try:
+        quotes = _fetch_fmp_json("quote", symbols, api_key)
+    except Exception as e:
+        logger.warning("Error fetching peer quotes for %s: %s", sector, e)
+        return {}
+    
+    # FMP reports errors and rate limits as a dict payload rather than a list
+    if not isinstance(quotes, list):
+        return {}
     
-    return peer_data
+    return {
+        item["symbol"].removesuffix(".NS"): item["pe"]
+        for item in quotes
+        if item.get("pe") and item["pe"] > 0
+    }
 
 # ────────────────────────────────────────────────────────────────────────
 # ──────────────────────────  Valuation Models  ──────────────────────
 # ────────────────────────────────────────────────────────────────────────
 
-@dataclass
+# Ten-year growth taper relative to a base rate, shared by the scenario and
+# sensitivity grids: 3 years at the full rate, 4 at 70% and 3 at 50%
+_GROWTH_TAPER = np.array([1.0] * 3 + [0.7] * 4 + [0.5] * 3)
+
+@dataclass(frozen=True, slots=True)
 class ScenarioSettings:
     name: str
     growth_multiplier: float
     discount_rate_adj: float
     terminal_growth_adj: float
 
-
-@dataclass
-class DDMSettings:
-    dividend_growth: float
-    discount_rate: float
-
-def dividend_discount_model(last_dividend: float, settings: DDMSettings) -> float:
-    if last_dividend <= 0 or settings.discount_rate <= settings.dividend_growth:
-        return 0
+def upside_pct(fair, price: float):
+    """Percent upside from price to fair value, for a scalar or an array of fair values.
     
-    next_div = last_dividend * (1 + settings.dividend_growth)
-    return next_div / (settings.discount_rate - settings.dividend_growth)
+    NaN where fair value is NaN, or everywhere if the price is missing or not positive.
+    """
+    if math.isnan(price) or price <= 0:
+        return fair * math.nan
+    return (fair - price) / price * 100
+
 
 def calculate_financial_ratios(income_df: pd.DataFrame, profile: dict) -> dict:
     """Calculate key financial ratios"""
     ratios = {}
     
     if not income_df.empty and income_df.shape[0] > 0:
-        latest_year = income_df.index[-1]
+        # Pull the needed columns once as arrays and index positionally
+        n_years = len(income_df)
+        rev = (income_df['revenue'].to_numpy(dtype=np.float64, na_value=np.nan)
+               if 'revenue' in income_df.columns else np.zeros(n_years))
+        ni = (income_df['netIncome'].to_numpy(dtype=np.float64, na_value=np.nan)
+              if 'netIncome' in income_df.columns else np.zeros(n_years))
         
         # Get latest year data
-        revenue = income_df.loc[latest_year].get('revenue', 0)
-        net_income = income_df.loc[latest_year].get('netIncome', 0)
+        revenue = rev[-1]
+        net_income = ni[-1]
         
         # Calculate ratios
         market_cap = profile.get('mktCap', 0)
@@ -580,33 +695,113 @@ def calculate_financial_ratios(income_df: pd.DataFrame, profile: dict) -> dict:
             ratios['Net Margin'] = net_income / revenue if revenue else 0
         
         # Revenue growth (if we have multiple years)
-        if len(income_df) > 1:
-            prev_revenue = income_df.iloc[-2].get('revenue', 0)
+        if n_years > 1:
+            prev_revenue = rev[-2]
             if prev_revenue > 0:
                 ratios['Revenue Growth'] = (revenue - prev_revenue) / prev_revenue
     
     return ratios
 
+@dataclass
+class AnalysisBundle:
+    """Fetched statements and the metrics derived from them for one ticker."""
+    cf: pd.DataFrame
+    div: pd.DataFrame
+    profile: dict
+    income: pd.DataFrame
+    owner_earnings: pd.Series
+    ratios: dict
+
+@st.cache_data(ttl=3600)  # Cache for 1 hour
+def load_analysis_bundle(ticker: str, provider: str, api_key: str) -> AnalysisBundle:
+    """Fetch and derive everything the page needs for a ticker under one cache key.
+    
+    This is the only Streamlit-cached entry point for data loading, so reruns
+    that leave the ticker and provider unchanged cost a single cache lookup.
+    """
+    if provider.startswith("Financial"):
+        cf_df, div_df, profile, income_df = fetch_fundamentals_fmp(ticker, api_key)
+    else:
+        cf_df, div_df, profile, income_df = fetch_fundamentals_yahoo(ticker)
+    
+    return AnalysisBundle(
+        cf=cf_df,
+        div=div_df,
+        profile=profile,
+        income=income_df,
+        owner_earnings=calc_owner_earnings(cf_df),
+        ratios=calculate_financial_ratios(income_df, profile)
+    )
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def compute_sensitivity(last_oe: float, discount_rate: float, terminal_growth: float,
+                        last_div: float, div_growth: float, growth_base: float) -> pd.DataFrame:
+    """Fair values over a grid of growth and discount rates around the chosen inputs.
+    
+    Rows are the base growth rate ±4% in 2% steps and columns the discount
+    rate ±2% in 1% steps. Only scalars are passed, so the cache key is cheap
+    to hash and reruns from unrelated widgets are cache hits.
+    """
+    # Simplified sensitivity for performance
+    discount_rates = discount_rate + 0.01 * np.arange(-2, 3)
+    growth_rate_range = growth_base + 0.02 * np.arange(-2, 3)
+    
+    # Value the whole grid in one batch: rows are growth rates, columns discount rates
+    grid_g, grid_d = np.meshgrid(growth_rate_range, discount_rates, indexing='ij')
+    if not math.isnan(last_oe):
+        dcf_grid = discounted_cash_flow_batch(
+            np.full(grid_g.size, last_oe),
+            grid_g.reshape(-1, 1) * _GROWTH_TAPER,
+            grid_d.ravel(),
+            terminal_growth
+        ).reshape(grid_g.shape)
+    else:
+        dcf_grid = np.zeros(grid_g.shape)
+    ddm_grid = np.broadcast_to(dividend_discount_grid(last_div, div_growth, discount_rates), grid_g.shape)
+    fair_grid = np.where(
+        (dcf_grid > 0) & (ddm_grid > 0),
+        (dcf_grid + ddm_grid) / 2,
+        np.where(dcf_grid > 0, dcf_grid, ddm_grid)
+    )
+    
+    # Matrix form feeds the heatmap as-is and exports as a readable grid
+    return pd.DataFrame(
+        fair_grid,
+        index=pd.Index([f"{gr:.1%}" for gr in growth_rate_range], name='Growth_Rate'),
+        columns=pd.Index([f"{dr:.1%}" for dr in discount_rates], name='Discount_Rate')
+    )
+
 # ────────────────────────────────────────────────────────────────────────
 # 📊 ─────────────────────────  Modern Visualizations  ────────────────────
 # ────────────────────────────────────────────────────────────────────────
+# Chart builders are cached on a content hash of their inputs and hand back the
+# same Figure instance (st.plotly_chart only serialises it, never mutates it).
+# Each chart is rendered with a stable key, so reruns with unchanged data reuse
+# the figure and the frontend updates the existing plot instead of remounting it.
+
+# Chart palettes and labels, allocated once at import
+_VALUATION_LABELS = np.array(['DCF Value', 'DDM Value', 'Fair Value', 'Current Price'])
+_VALUATION_COLORS = np.array(['#6366f1', '#8b5cf6', '#06d6a0', '#f59e0b'])
+_SCENARIO_COLORS = np.array(['#ef4444', '#6366f1', '#10b981'])  # Red, Blue, Green
+
+def _fmt_inr(values) -> np.ndarray:
+    """Format values as whole-rupee bar labels, e.g. ₹1,234."""
+    return pd.Series(values, dtype=np.float64).map("₹{:,.0f}".format).to_numpy()
 
+@st.cache_resource(show_spinner=False, max_entries=32)
 def create_modern_valuation_chart(dcf_val, ddm_val, fair_val, current_price):
     """Create beautiful valuation comparison chart"""
     
     # Create data
-    values = [dcf_val, ddm_val, fair_val, current_price]
-    labels = ['DCF Value', 'DDM Value', 'Fair Value', 'Current Price']
-    colors = ['#6366f1', '#8b5cf6', '#06d6a0', '#f59e0b']
+    values = np.asarray([dcf_val, ddm_val, fair_val, current_price], dtype=np.float64)
     
-    # Filter out NaN values
-    valid_data = [(label, value, color) for label, value, color in zip(labels, values, colors) 
-                  if not math.isnan(value) and value > 0]
+    # Filter out NaN and non-positive values
+    mask = np.isfinite(values) & (values > 0)
     
-    if not valid_data:
+    if not mask.any():
         return None
     
-    labels_clean, values_clean, colors_clean = zip(*valid_data)
+    labels_clean, values_clean, colors_clean = _VALUATION_LABELS[mask], values[mask], _VALUATION_COLORS[mask]
     
     fig = go.Figure()
     
@@ -618,7 +813,7 @@ def create_modern_valuation_chart(dcf_val, ddm_val, fair_val, current_price):
             color=colors_clean,
             line=dict(color='rgba(255,255,255,0.3)', width=2)
         ),
-        text=[f"₹{v:,.0f}" for v in values_clean],
+        text=_fmt_inr(values_clean),
         textposition='auto',
         textfont=dict(size=14, color='white', family='Inter'),
         hovertemplate='<b>%{x}</b><br>Value: ₹%{y:,.0f}<extra></extra>'
@@ -648,21 +843,22 @@ def create_modern_valuation_chart(dcf_val, ddm_val, fair_val, current_price):
     
     return fig
 
+@st.cache_resource(show_spinner=False, max_entries=32)
 def create_modern_owner_earnings_chart(owner_earnings_series):
     """Create modern owner earnings trend chart"""
     if owner_earnings_series.empty:
         return None
     
-    oe_df = owner_earnings_series.tail(10).reset_index()
-    oe_df.columns = ['Year', 'Owner_Earnings']
-    oe_df['Owner_Earnings_Billions'] = oe_df['Owner_Earnings'] / 1e9
+    # Plain arrays skip Plotly's pandas coercion; float32 is ample for a chart
+    years = owner_earnings_series.index.to_numpy()[-10:]
+    oe_billions = (owner_earnings_series.to_numpy(dtype=np.float64)[-10:] / 1e9).astype(np.float32)
     
     fig = go.Figure()
     
-    # Add area chart with gradient
-    fig.add_trace(go.Scatter(
-        x=oe_df['Year'],
-        y=oe_df['Owner_Earnings_Billions'],
+    # Add area chart with gradient (WebGL rendering)
+    fig.add_trace(go.Scattergl(
+        x=years,
+        y=oe_billions,
         mode='lines+markers',
         fill='tonexty',
         fillcolor='rgba(99, 102, 241, 0.2)',
@@ -679,6 +875,8 @@ def create_modern_owner_earnings_chart(owner_earnings_series):
         ),
         xaxis=dict(
             showgrid=False,
+            # One tick per year on FMP's integer years; date axes (Yahoo) keep automatic ticks
+            dtick=1 if np.issubdtype(years.dtype, np.integer) else None,
             tickfont=dict(size=11, color='#6b7280', family='Inter'),
             title=dict(text="Year", font=dict(size=12, color='#374151'))
         ),
@@ -696,20 +894,18 @@ def create_modern_owner_earnings_chart(owner_earnings_series):
     
     return fig
 
+@st.cache_resource(show_spinner=False, max_entries=32)
 def create_modern_dividend_chart(div_df):
     """Create modern dividend trend chart"""
     if div_df.empty or "dividend" not in div_df.columns:
         return None
     
-    div_chart_df = div_df.tail(20).reset_index()
-    div_chart_df['date'] = pd.to_datetime(div_chart_df['date'])
-    
     fig = go.Figure()
     
-    # Add line with markers
-    fig.add_trace(go.Scatter(
-        x=div_chart_df['date'],
-        y=div_chart_df['dividend'],
+    # Add line with markers (WebGL rendering)
+    fig.add_trace(go.Scattergl(
+        x=div_df.index.to_numpy()[-20:],
+        y=div_df['dividend'].to_numpy(dtype=np.float32)[-20:],
         mode='lines+markers',
         line=dict(color='#06d6a0', width=3),
         marker=dict(size=6, color='#06d6a0'),
@@ -741,24 +937,19 @@ def create_modern_dividend_chart(div_df):
     
     return fig
 
-def create_scenario_comparison_chart(scenario_results):
-    """Create beautiful scenario comparison chart"""
-    df = pd.DataFrame(scenario_results)
-    
+@st.cache_resource(show_spinner=False, max_entries=32)
+def create_scenario_comparison_chart(fair_values: pd.Series):
+    """Create beautiful scenario comparison chart from fair values indexed by scenario name"""
     fig = go.Figure()
     
-    scenarios = df['Scenario']
-    fair_values = df['Fair Value']
-    colors = ['#ef4444', '#6366f1', '#10b981']  # Red, Blue, Green
-    
     fig.add_trace(go.Bar(
-        x=scenarios,
+        x=fair_values.index,
         y=fair_values,
         marker=dict(
-            color=colors,
+            color=_SCENARIO_COLORS[:len(fair_values)],
             line=dict(color='white', width=2)
         ),
-        text=[f"₹{v:,.0f}" for v in fair_values],
+        text=_fmt_inr(fair_values),
         textposition='auto',
         textfont=dict(size=14, color='white', family='Inter', weight='bold'),
         hovertemplate='<b>%{x} Case</b><br>Fair Value: ₹%{y:,.0f}<extra></extra>'
@@ -788,21 +979,22 @@ def create_scenario_comparison_chart(scenario_results):
     
     return fig
 
+@st.cache_resource(show_spinner=False, max_entries=32)
 def create_sensitivity_heatmap(sensitivity_df: pd.DataFrame):
-    """Create beautiful sensitivity analysis heatmap"""
+    """Create beautiful sensitivity analysis heatmap
+    
+    ``sensitivity_df`` is the fair-value matrix: one row per growth rate and
+    one column per discount rate, labelled with formatted percentages.
+    """
     if sensitivity_df.empty:
         return None
     
-    # Pivot the data for heatmap
-    pivot_df = sensitivity_df.pivot(index='Growth_Rate', columns='Discount_Rate', values='Fair_Value')
-    
     fig = go.Figure(data=go.Heatmap(
-        z=pivot_df.values,
-        x=pivot_df.columns,
-        y=pivot_df.index,
+        z=sensitivity_df.to_numpy(),
+        x=sensitivity_df.columns.to_numpy(),
+        y=sensitivity_df.index.to_numpy(),
         colorscale='RdYlGn',
-        text=pivot_df.values.round(0),
-        texttemplate="₹%{text:,.0f}",
+        texttemplate="₹%{z:,.0f}",
         textfont={"size": 10, "family": "Inter", "color": "white"},
         hovertemplate='<b>Sensitivity Analysis</b><br>Discount Rate: %{x}<br>Growth Rate: %{y}<br>Fair Value: ₹%{z:,.0f}<extra></extra>',
         colorbar=dict(
@@ -838,26 +1030,33 @@ def create_sensitivity_heatmap(sensitivity_df: pd.DataFrame):
 # 📤 ─────────────────────────  Export Functions  ─────────────────────────
 # ────────────────────────────────────────────────────────────────────────
 
+# Summary metrics in export order, with their keys in the valuations dict
+_EXPORT_LABELS = ('DCF Value', 'DDM Value', 'Fair Value', 'Target Price', 'Current Price', 'Upside %')
+_EXPORT_KEYS = ('dcf_val', 'ddm_val', 'fair_val', 'target_price', 'current_price', 'upside')
+
+def _summary_frame(valuations: dict) -> pd.DataFrame:
+    """Summary rows in a fixed metric order; missing values export as 0"""
+    return pd.DataFrame({
+        'Metric': _EXPORT_LABELS,
+        'Value': [valuations.get(k, 0) for k in _EXPORT_KEYS]
+    })
+
+# xlsxwriter serialises noticeably faster than openpyxl; use it when installed
+_EXCEL_ENGINE = 'xlsxwriter' if importlib.util.find_spec('xlsxwriter') else 'openpyxl'
+
+@st.cache_data(ttl=600, max_entries=16, show_spinner=False)
 def create_excel_report(ticker: str, valuations: dict, ratios: dict, historical_df: pd.DataFrame, 
                        sensitivity_df: pd.DataFrame) -> bytes:
-    """Create comprehensive Excel report"""
+    """Create comprehensive Excel report
+    
+    Cached on the report contents, so clicking the export button again for
+    the same analysis returns the existing bytes without re-serialising.
+    """
     output = io.BytesIO()
     
-    with pd.ExcelWriter(output, engine='openpyxl') as writer:
+    with pd.ExcelWriter(output, engine=_EXCEL_ENGINE) as writer:
         # Summary sheet
-        summary_data = {
-            'Metric': ['DCF Value', 'DDM Value', 'Fair Value', 'Target Price', 'Current Price', 'Upside %'],
-            'Value': [
-                valuations.get('dcf_val', 0),
-                valuations.get('ddm_val', 0),
-                valuations.get('fair_val', 0),
-                valuations.get('target_price', 0),
-                valuations.get('current_price', 0),
-                valuations.get('upside', 0)
-            ]
-        }
-        summary_df = pd.DataFrame(summary_data)
-        summary_df.to_excel(writer, sheet_name='Summary', index=False)
+        _summary_frame(valuations).to_excel(writer, sheet_name='Summary', index=False)
         
         # Ratios sheet
         if ratios:
@@ -870,11 +1069,16 @@ def create_excel_report(ticker: str, valuations: dict, ratios: dict, historical_
         
         # Sensitivity analysis
         if not sensitivity_df.empty:
-            sensitivity_df.to_excel(writer, sheet_name='Sensitivity_Analysis', index=False)
+            sensitivity_df.to_excel(writer, sheet_name='Sensitivity_Analysis')
     
     output.seek(0)
     return output.getvalue()
 
+@st.cache_data(ttl=600, max_entries=16, show_spinner=False)
+def create_csv_summary(valuations: dict) -> bytes:
+    """Create the CSV summary as UTF-8 bytes, cached like the Excel report"""
+    return _summary_frame(valuations).to_csv(index=False).encode("utf-8")
+
 # ────────────────────────────────────────────────────────────────────────
 # 🧮 ───────────────────────  Main Application  ─────────────────────────
 # ────────────────────────────────────────────────────────────────────────
@@ -962,6 +1166,7 @@ def main():
             base_growth = st.number_input("Growth Years 1-3 (%)", 0.0, 30.0, 12.0, 1.0)
             mid_growth = st.number_input("Growth Years 4-7 (%)", 0.0, 20.0, 8.0, 1.0)
             tail_growth = st.number_input("Growth Years 8-10 (%)", 0.0, 10.0, 5.0, 1.0)
+            growth_rates = [base_growth / 100] * 3 + [mid_growth / 100] * 4 + [tail_growth / 100] * 3
 
         st.divider()
         
@@ -992,21 +1197,19 @@ def main():
         ), unsafe_allow_html=True)
         return
 
-    # Progress bar for data fetching
-    progress_bar = st.progress(0)
-    status_text = st.empty()
+    # Progress bar for data fetching, shown only when the ticker or provider
+    # changes; other reruns are served from the bundle cache with no work to report
+    bundle_key = (ticker, provider)
+    show_progress = st.session_state.get("loaded_bundle") != bundle_key
+    if show_progress:
+        progress_bar = st.progress(25)
+        status_text = st.empty()
+        status_text.text("🔄 Fetching financial data...")
     
     try:
-        status_text.text("🔄 Fetching financial data...")
-        progress_bar.progress(25)
-        
-        if provider.startswith("Financial"):
-            cf_df, div_df, profile, income_df = fetch_fundamentals_fmp(ticker, api_key)
-        else:
-            cf_df, div_df, profile, income_df = fetch_fundamentals_yahoo(ticker)
-        
-        progress_bar.progress(75)
-        status_text.text("📊 Processing financial metrics...")
+        bundle = load_analysis_bundle(ticker, provider, api_key)
+        st.session_state["loaded_bundle"] = bundle_key
+        div_df, profile = bundle.div, bundle.profile
         
         # Calculate key metrics
         shares_out = profile.get("sharesOutstanding") or profile.get("mktCap", 0) / max(profile.get("price", 1), 1)
@@ -1015,25 +1218,23 @@ def main():
             
         last_price = profile.get("price") or profile.get("previousClose") or math.nan
         
-        # Calculate financial ratios
-        ratios = calculate_financial_ratios(income_df, profile)
+        # Financial ratios and owner earnings come precomputed with the bundle
+        ratios = bundle.ratios
         
-        owner_earnings_series = calc_owner_earnings(cf_df)
-        last_oe = owner_earnings_series.iloc[-1] if not owner_earnings_series.empty else math.nan
+        owner_earnings_series = bundle.owner_earnings
+        # Plain array for scalar lookups; the chart still takes the Series for its year index
+        oe_arr = owner_earnings_series.to_numpy(dtype=np.float64)
+        last_oe = oe_arr[-1] if oe_arr.size else math.nan
         last_div = div_df["dividend"].iloc[-1] if not div_df.empty and "dividend" in div_df.columns else 0
         
-        progress_bar.progress(100)
-        status_text.text("✅ Data loaded successfully!")
-        
-        # Clear progress indicators
-        progress_bar.empty()
-        status_text.empty()
-        
     except Exception as e:
-        progress_bar.empty()
-        status_text.empty()
         st.error(f"❌ Data fetch failed: {e}")
         st.stop()
+    finally:
+        # Clear progress indicators
+        if show_progress:
+            progress_bar.empty()
+            status_text.empty()
 
     # ── Company Information Header ───────────────────────────────────────
     company_name = profile.get('companyName', ticker.replace('.NS', ''))
@@ -1051,6 +1252,8 @@ def main():
     """, unsafe_allow_html=True)
 
     # ── Main Analysis Based on Mode ──────────────────────────────────────
+    # Filled by the standard valuation branch; exports fall back to zeros
+    valuations = {}
     if "Scenario" in analysis_mode:
         # Scenario Analysis
         scenarios = [
@@ -1059,71 +1262,59 @@ def main():
             ScenarioSettings("🐂 Bull", bull_multiplier, -0.01, 0.005)
         ]
         
-        scenario_results = []
+        # Value all scenarios in one batch: one growth path per row
+        multipliers = np.array([sc.growth_multiplier for sc in scenarios])
+        scenario_drs = discount_rate + np.array([sc.discount_rate_adj for sc in scenarios])
+        scenario_tgs = terminal_growth + np.array([sc.terminal_growth_adj for sc in scenarios])
+        growth_paths = (base_growth / 100 * multipliers)[:, None] * _GROWTH_TAPER
         
-        for scenario in scenarios:
-            adj_growth = base_growth / 100 * scenario.growth_multiplier
-            growth_rates = [adj_growth] * 3 + [adj_growth * 0.7] * 4 + [adj_growth * 0.5] * 3
-            
-            dcf_settings = DCFSettings(
-                growth_rates=growth_rates,
-                discount_rate=discount_rate + scenario.discount_rate_adj,
-                terminal_growth=terminal_growth + scenario.terminal_growth_adj,
-                shares_outstanding=shares_out
+        if not math.isnan(last_oe):
+            dcf_vals = discounted_cash_flow_batch(
+                np.full(len(scenarios), last_oe), growth_paths, scenario_drs, scenario_tgs
             )
-            
-            dcf_val = discounted_cash_flow(last_oe, dcf_settings) if not math.isnan(last_oe) else math.nan
-            ddm_val = dividend_discount_model(last_div, DDMSettings(div_growth, discount_rate + scenario.discount_rate_adj))
-            
-            fair = (dcf_val + ddm_val) / 2 if not math.isnan(dcf_val) and ddm_val > 0 else (dcf_val if not math.isnan(dcf_val) else ddm_val)
-            target = fair * (1 - mos / 100) if not math.isnan(fair) else math.nan
-            upside = ((fair - last_price) / last_price * 100) if not math.isnan(fair) and not math.isnan(last_price) and last_price > 0 else math.nan
-            
-            scenario_results.append({
-                'Scenario': scenario.name,
-                'DCF Value': dcf_val,
-                'DDM Value': ddm_val,
-                'Fair Value': fair,
-                'Target Price': target,
-                'Upside %': upside
-            })
+        else:
+            dcf_vals = np.full(len(scenarios), math.nan)
+        ddm_vals = dividend_discount_grid(last_div, div_growth, scenario_drs)
+        
+        has_dcf = ~np.isnan(dcf_vals)
+        fair_vals = np.where(has_dcf & (ddm_vals > 0), (dcf_vals + ddm_vals) / 2,
+                             np.where(has_dcf, dcf_vals, ddm_vals))
+        scenario_names = [sc.name for sc in scenarios]
+        scenario_upsides = upside_pct(fair_vals, last_price)
+        
+        # The sensitivity section reads growth_rates; as before, that is the last scenario's path
+        growth_rates = growth_paths[-1].tolist()
 
         # Display scenario results with modern styling
         st.markdown('<div class="glass-card">', unsafe_allow_html=True)
         
         # Create scenario comparison chart
-        scenario_chart = create_scenario_comparison_chart(scenario_results)
+        scenario_chart = create_scenario_comparison_chart(
+            pd.Series(fair_vals, index=scenario_names, name='Fair Value')
+        )
         if scenario_chart:
-            st.plotly_chart(scenario_chart, use_container_width=True)
+            st.plotly_chart(scenario_chart, use_container_width=True, key="chart_scenarios")
         
         # Scenario metrics cards
-        cols = st.columns(3)
-        for i, result in enumerate(scenario_results):
-            with cols[i]:
-                scenario_name = result['Scenario']
-                fair_value = result['Fair Value']
-                upside = result['Upside %']
-                
-                upside_text = f"{upside:+.1f}%" if not math.isnan(upside) else "—"
-                upside_color = "inverse" if not math.isnan(upside) and upside > 0 else "normal"
-                
-                st.markdown(
-                    create_metric_card(
-                        scenario_name, 
-                        f"₹{fair_value:,.0f}" if not math.isnan(fair_value) else "—",
-                        upside_text,
-                        upside_color
-                    ), 
-                    unsafe_allow_html=True
-                )
+        scenario_cards = []
+        for scenario_name, fair_value, upside in zip(
+            scenario_names, fair_vals.tolist(), scenario_upsides.tolist()
+        ):
+            upside_text = f"{upside:+.1f}%" if not math.isnan(upside) else "—"
+            upside_color = "inverse" if not math.isnan(upside) and upside > 0 else "normal"
+            
+            scenario_cards.append(create_metric_card(
+                scenario_name, 
+                f"₹{fair_value:,.0f}" if not math.isnan(fair_value) else "—",
+                upside_text,
+                upside_color
+            ))
+        st.markdown(create_metric_row(scenario_cards), unsafe_allow_html=True)
         
         st.markdown('</div>', unsafe_allow_html=True)
         
     else:
         # Standard Valuation Analysis
-        if "Scenario" not in analysis_mode:
-            growth_rates = [base_growth / 100] * 3 + [mid_growth / 100] * 4 + [tail_growth / 100] * 3
-        
         # Calculate valuations
         dcf_val = discounted_cash_flow(
             last_owner_earnings=last_oe,
@@ -1151,7 +1342,7 @@ def main():
             fair = math.nan
 
         target_price = fair * (1 - mos / 100) if not math.isnan(fair) else math.nan
-        upside = ((fair - last_price) / last_price * 100) if not math.isnan(fair) and not math.isnan(last_price) and last_price > 0 else math.nan
+        upside = upside_pct(fair, last_price)
 
         # Store valuations for export
         valuations = {
@@ -1169,38 +1360,18 @@ def main():
         # Main valuation chart
         val_chart = create_modern_valuation_chart(dcf_val, ddm_val, fair, last_price)
         if val_chart:
-            st.plotly_chart(val_chart, use_container_width=True)
+            st.plotly_chart(val_chart, use_container_width=True, key="chart_valuation")
         
         # Metrics row
-        col1, col2, col3, col4, col5 = st.columns(5)
-        
-        with col1:
-            st.markdown(
-                create_metric_card("DCF Value", f"₹{dcf_val:,.0f}" if not math.isnan(dcf_val) else "—"),
-                unsafe_allow_html=True
-            )
-        with col2:
-            st.markdown(
-                create_metric_card("DDM Value", f"₹{ddm_val:,.0f}" if ddm_val > 0 else "—"),
-                unsafe_allow_html=True
-            )
-        with col3:
-            st.markdown(
-                create_metric_card("Fair Value", f"₹{fair:,.0f}" if not math.isnan(fair) else "—"),
-                unsafe_allow_html=True
-            )
-        with col4:
-            st.markdown(
-                create_metric_card("Target Price", f"₹{target_price:,.0f}" if not math.isnan(target_price) else "—"),
-                unsafe_allow_html=True
-            )
-        with col5:
-            upside_text = f"{upside:+.1f}%" if not math.isnan(upside) else "—"
-            upside_color = "inverse" if not math.isnan(upside) and upside > 0 else "normal"
-            st.markdown(
-                create_metric_card("Upside", upside_text, delta_color=upside_color),
-                unsafe_allow_html=True
-            )
+        upside_text = f"{upside:+.1f}%" if not math.isnan(upside) else "—"
+        upside_color = "inverse" if not math.isnan(upside) and upside > 0 else "normal"
+        st.markdown(create_metric_row([
+            create_metric_card("DCF Value", f"₹{dcf_val:,.0f}" if not math.isnan(dcf_val) else "—"),
+            create_metric_card("DDM Value", f"₹{ddm_val:,.0f}" if ddm_val > 0 else "—"),
+            create_metric_card("Fair Value", f"₹{fair:,.0f}" if not math.isnan(fair) else "—"),
+            create_metric_card("Target Price", f"₹{target_price:,.0f}" if not math.isnan(target_price) else "—"),
+            create_metric_card("Upside", upside_text, delta_color=upside_color)
+        ]), unsafe_allow_html=True)
         
         st.markdown('</div>', unsafe_allow_html=True)
 
@@ -1209,24 +1380,10 @@ def main():
         st.markdown('<div class="glass-card">', unsafe_allow_html=True)
         st.markdown("### 📊 Financial Health Dashboard")
         
-        ratio_cols = st.columns(len(ratios))
-        for i, (ratio_name, ratio_value) in enumerate(ratios.items()):
-            with ratio_cols[i]:
-                if isinstance(ratio_value, float):
-                    if "Growth" in ratio_name or "Margin" in ratio_name:
-                        display_val = f"{ratio_value:.1%}"
-                        delta_color = "inverse" if ratio_value > 0 else "normal"
-                    else:
-                        display_val = f"{ratio_value:.2f}"
-                        delta_color = "normal"
-                else:
-                    display_val = str(ratio_value)
-                    delta_color = "normal"
-                
-                st.markdown(
-                    create_metric_card(ratio_name, display_val),
-                    unsafe_allow_html=True
-                )
+        st.markdown(create_metric_row([
+            create_metric_card(ratio_name, _format_ratio(ratio_name, ratio_value))
+            for ratio_name, ratio_value in ratios.items()
+        ]), unsafe_allow_html=True)
         
         st.markdown('</div>', unsafe_allow_html=True)
 
@@ -1235,36 +1392,15 @@ def main():
         # Sensitivity Analysis
         st.markdown('<div class="glass-card">', unsafe_allow_html=True)
         
-        # Calculate sensitivity
-        base_dcf_settings = DCFSettings(growth_rates if 'growth_rates' in locals() else [0.12]*10, discount_rate, terminal_growth, shares_out)
-        base_ddm_settings = DDMSettings(div_growth, discount_rate)
-        
-        # Simplified sensitivity for performance
-        discount_rates = [discount_rate + i*0.01 for i in range(-2, 3)]
-        growth_rate_base = growth_rates[0] if 'growth_rates' in locals() else 0.12
-        growth_rate_range = [growth_rate_base + i*0.02 for i in range(-2, 3)]
-        
-        sensitivity_data = []
-        for dr in discount_rates:
-            for gr in growth_rate_range:
-                new_growth_rates = [gr] * 3 + [gr * 0.7] * 4 + [gr * 0.5] * 3
-                new_settings = DCFSettings(new_growth_rates, dr, terminal_growth, shares_out)
-                
-                dcf_sens = discounted_cash_flow(last_oe, new_settings) if not math.isnan(last_oe) else 0
-                ddm_sens = dividend_discount_model(last_div, DDMSettings(div_growth, dr))
-                fair_sens = (dcf_sens + ddm_sens) / 2 if dcf_sens > 0 and ddm_sens > 0 else (dcf_sens if dcf_sens > 0 else ddm_sens)
-                
-                sensitivity_data.append({
-                    'Discount_Rate': f"{dr:.1%}",
-                    'Growth_Rate': f"{gr:.1%}",
-                    'Fair_Value': fair_sens
-                })
-        
-        sensitivity_df = pd.DataFrame(sensitivity_data)
+        # Calculate sensitivity (cached, so unrelated widget changes skip the grid)
+        sensitivity_df = compute_sensitivity(
+            float(last_oe), float(discount_rate), float(terminal_growth),
+            float(last_div), float(div_growth), float(growth_rates[0])
+        )
         
         sens_chart = create_sensitivity_heatmap(sensitivity_df)
         if sens_chart:
-            st.plotly_chart(sens_chart, use_container_width=True)
+            st.plotly_chart(sens_chart, use_container_width=True, key="chart_sensitivity")
         
         st.markdown('</div>', unsafe_allow_html=True)
 
@@ -1276,11 +1412,11 @@ def main():
         
         oe_chart = create_modern_owner_earnings_chart(owner_earnings_series)
         if oe_chart:
-            st.plotly_chart(oe_chart, use_container_width=True)
+            st.plotly_chart(oe_chart, use_container_width=True, key="chart_owner_earnings")
             
             # Growth analysis
-            if len(owner_earnings_series) > 1:
-                recent_growth = ((owner_earnings_series.iloc[-1] / owner_earnings_series.iloc[-2]) - 1) * 100
+            if oe_arr.size > 1:
+                recent_growth = ((oe_arr[-1] / oe_arr[-2]) - 1) * 100
                 growth_status = "positive" if recent_growth > 0 else "negative"
                 st.markdown(f"""
                 <div class="status-{growth_status}">
@@ -1297,11 +1433,11 @@ def main():
         
         div_chart = create_modern_dividend_chart(div_df)
         if div_chart:
-            st.plotly_chart(div_chart, use_container_width=True)
+            st.plotly_chart(div_chart, use_container_width=True, key="chart_dividends")
             
             # Dividend analysis
             if not div_df.empty and len(div_df) > 1:
-                annual_divs = div_df.groupby(div_df.index.str[:4])['dividend'].sum()
+                annual_divs = div_df.groupby(div_df.index.year)['dividend'].sum()
                 if len(annual_divs) > 1:
                     div_growth_rate = ((annual_divs.iloc[-1] / annual_divs.iloc[-2]) - 1) * 100
                     growth_status = "positive" if div_growth_rate > 0 else "negative"
@@ -1327,8 +1463,8 @@ def main():
                 try:
                     excel_data = create_excel_report(
                         ticker, valuations, ratios, 
-                        pd.DataFrame() if 'historical_df' not in locals() else pd.DataFrame(),
-                        sensitivity_df if 'sensitivity_df' in locals() else pd.DataFrame()
+                        pd.DataFrame(),
+                        sensitivity_df
                     )
                     
                     st.download_button(
@@ -1344,19 +1480,7 @@ def main():
         with col2:
             if st.button("📄 Generate CSV Summary"):
                 try:
-                    summary_data = {
-                        'Metric': ['DCF Value', 'DDM Value', 'Fair Value', 'Target Price', 'Current Price', 'Upside %'],
-                        'Value': [
-                            valuations.get('dcf_val', 0) if 'valuations' in locals() else 0,
-                            valuations.get('ddm_val', 0) if 'valuations' in locals() else 0,
-                            valuations.get('fair_val', 0) if 'valuations' in locals() else 0,
-                            valuations.get('target_price', 0) if 'valuations' in locals() else 0,
-                            valuations.get('current_price', 0) if 'valuations' in locals() else 0,
-                            valuations.get('upside', 0) if 'valuations' in locals() else 0
-                        ]
-                    }
-                    summary_df = pd.DataFrame(summary_data)
-                    csv_data = summary_df.to_csv(index=False)
+                    csv_data = create_csv_summary(valuations)
                     
                     st.download_button(
                         label="💾 Download CSV File",
@@ -8,3 +8,6 @@ supported_fmp_tickers = [
     # Canada Large Caps (TSX, .TO)
     "RY.TO", "TD.TO", "BNS.TO", "ENB.TO", "BAM.TO", "BMO.TO", "CM.TO", "TRP.TO", "CNR.TO", "SU.TO"
 ]
+
+# Read-only set view for constant-time membership checks
+SUPPORTED_FMP_TICKERS_SET: frozenset[str] = frozenset(supported_fmp_tickers)
@@ -0,0 +1,24 @@
+"""Tests for the batch DCF entry point."""
+
+import numpy as np
+
+from ivnse.models import DCFSettings, discounted_cash_flow, discounted_cash_flow_batch
+
+
+def test_batch_accepts_read_only_growth_matrix():
+    growth = np.full((3, 10), 0.1)
+    growth.setflags(write=False)
+
+    values = discounted_cash_flow_batch(np.full(3, 100.0), growth, 0.12, 0.02)
+
+    expected = discounted_cash_flow(100.0, DCFSettings([0.1] * 10, 0.12, 0.02, 1.0))
+    np.testing.assert_array_equal(values, np.full(3, expected))
+
+
+def test_batch_accepts_broadcast_growth_path():
+    growth = np.broadcast_to(np.full(10, 0.1), (3, 10))
+
+    values = discounted_cash_flow_batch(np.full(3, 100.0), growth, 0.12, 0.02)
+
+    expected = discounted_cash_flow(100.0, DCFSettings([0.1] * 10, 0.12, 0.02, 1.0))
+    np.testing.assert_array_equal(values, np.full(3, expected))
@@ -0,0 +1,77 @@
+"""Tests that throttled or failed provider responses never reach the disk cache."""
+
+import sys
+import types
+
+import diskcache
+import pandas as pd
+import pytest
+
+from ivnse.data import cache as cache_module
+from ivnse.ui import home
+
+
+@pytest.fixture
+def disk_cache(tmp_path, monkeypatch):
+    cache = diskcache.Cache(str(tmp_path))
+    monkeypatch.setattr(cache_module, "_cache", cache)
+    yield cache
+    cache.close()
+
+
+class _Response:
+    def __init__(self, payload):
+        self._payload = payload
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._payload
+
+
+@pytest.mark.parametrize("payload", [{"Error Message": "Limit Reach"}, [], {}])
+def test_fmp_error_payload_is_not_cached(disk_cache, monkeypatch, payload):
+    monkeypatch.setattr(home._SESSION, "get", lambda *args, **kwargs: _Response(payload))
+
+    assert home._fetch_fmp_json("profile", "TCS.NS", "key") == payload
+    assert len(disk_cache) == 0
+
+
+def test_fmp_records_are_cached(disk_cache, monkeypatch):
+    monkeypatch.setattr(home._SESSION, "get", lambda *args, **kwargs: _Response([{"symbol": "TCS.NS"}]))
+
+    home._fetch_fmp_json("profile", "TCS.NS", "key")
+    assert len(disk_cache) == 1
+
+
+def _install_yfinance(monkeypatch, cashflow, dividends, financials, info):
+    class Ticker:
+        def __init__(self, symbol):
+            self.cashflow = cashflow
+            self.dividends = dividends
+            self.financials = financials
+            self.info = info
+
+    monkeypatch.setitem(sys.modules, "yfinance", types.SimpleNamespace(Ticker=Ticker))
+
+
+def test_yahoo_empty_response_is_not_cached(disk_cache, monkeypatch):
+    _install_yfinance(monkeypatch, pd.DataFrame(), pd.Series(dtype=float), pd.DataFrame(), {})
+
+    cf, div, info, income = home.fetch_fundamentals_yahoo("TCS.NS")
+    assert cf.empty and div.empty and income.empty and not info
+    assert len(disk_cache) == 0
+
+
+def test_yahoo_data_is_cached(disk_cache, monkeypatch):
+    _install_yfinance(
+        monkeypatch,
+        pd.DataFrame({"2023-03-31": [100.0]}, index=["Operating Cash Flow"]),
+        pd.Series([1.0], index=pd.to_datetime(["2023-06-01"])),
+        pd.DataFrame({"2023-03-31": [1000.0]}, index=["Total Revenue"]),
+        {"currentPrice": 50.0},
+    )
+
+    home.fetch_fundamentals_yahoo("TCS.NS")
+    assert len(disk_cache) == 2